@@ -3,230 +3,389 @@ This module provides a GUI tool for collecting answers from a human client
 based on provided questions and respective options in a questionnaire.
 """
 
-from textwrap import dedent
+import io
 
-from typing import Dict, List, Type
+from types import SimpleNamespace
+from typing import List, Type
 
 from pydantic import BaseModel, Field
 
-import tkinter as tk
-
-import ttkbootstrap as ttk
-from ttkbootstrap import Style
-from ttkbootstrap.scrolled import ScrolledFrame
-from ttkbootstrap.constants import *
-
 from crewai_tools import BaseTool
 
 # Constants for window size and text wrap length
 WINDOW_SIZE = (480, 640)
-WRAP_LENGTH = WINDOW_SIZE[0] - 60
-
-
-class Header(ttk.Frame):
-    """
-    A frame that displays the header of the questionnaire, including the title,
-    author, and introduction.
-    """
-
-    def __init__(self, master, title, author, introduction, **kwargs) -> None:
-        super().__init__(master, **kwargs)
-        self.title = title
-        self.author = author
-        self.introduction = introduction
+WRAP_MARGIN = 60
+WRAP_LENGTH = WINDOW_SIZE[0] - WRAP_MARGIN
 
-        self.create_widgets()
+# Approximate heights used to reserve space for questions not yet displayed
+QUESTION_LABEL_HEIGHT = 40
+OPTION_HEIGHT = 30
+CUSTOM_OPTION_HEIGHT = 60
 
-    def create_widgets(self) -> None:
-        """Create and pack the widgets for the header."""
-        ttk.Label(
-            self,
-            text=self.title,
-            font=("Helvetica", 16, "bold"),
-            justify=CENTER,
-            wraplength=WRAP_LENGTH,
-            bootstyle=PRIMARY,
-        ).pack(pady=10)
-
-        ttk.Label(
-            self,
-            text=self.author,
-            font=("Helvetica", 12, "bold"),
-            justify=CENTER,
-            wraplength=WRAP_LENGTH,
-            bootstyle=SECONDARY,
-        ).pack(pady=5)
-
-        ttk.Label(
-            self,
-            text=self.introduction,
-            font=("Helvetica", 12),
-            justify=LEFT,
-            wraplength=WRAP_LENGTH,
-            bootstyle=DEFAULT,
-        ).pack(pady=10)
+# Widget defaults set once in the Tk option database instead of being passed
+# to every widget
+OPTION_DEFAULTS = {
+    "*TLabel.wrapLength": WRAP_LENGTH,
+    "*TLabel.justify": "left",
+}
 
+# Fonts shared by all the widgets, created by create_fonts() once the Tk root
+# window exists
+FONT_H1 = None
+FONT_BOLD = None
+FONT_NORMAL = None
 
-class OptionFrame(ttk.Frame):
-    """
-    A frame that displays an option for a question, including a check button
-    and a label for the option text.
-    """
 
-    def __init__(self, master, option, **kwargs) -> None:
-        super().__init__(master, **kwargs)
-        self.option = option
+def create_fonts() -> None:
+    """Create the fonts shared by all the widgets of the questionnaire."""
+    from tkinter.font import Font
 
-        self.create_widgets()
+    global FONT_H1, FONT_BOLD, FONT_NORMAL
+    FONT_H1 = Font(family="Helvetica", size=16, weight="bold")
+    FONT_BOLD = Font(family="Helvetica", size=12, weight="bold")
+    FONT_NORMAL = Font(family="Helvetica", size=12)
 
-    def create_widgets(self) -> None:
-        """Create and pack the widgets for the option."""
-        self.check_button = ttk.Checkbutton(self)
-        self.check_button.pack(side=LEFT)
 
-        ttk.Label(self, text=self.option, wraplength=WRAP_LENGTH, justify=LEFT).pack(
-            side=LEFT
-        )
+# The GUI toolkit and the widget classes built on it, loaded by load_gui()
+gui = None
 
 
-class CommentFrame(ttk.Frame):
+def load_gui() -> SimpleNamespace:
     """
-    A frame that allows the client to add additional comments.
-    """
-
-    def __init__(self, master, **kwargs) -> None:
-        super().__init__(master, **kwargs)
-
-        self.create_widgets()
-
-    def create_widgets(self) -> None:
-        """Create and pack the widgets for the comment section."""
-        ttk.Label(
-            self,
-            text="Any other comments?",
-            font=("Helvetica", 12, "bold"),
-            justify=LEFT,
-            wraplength=WRAP_LENGTH,
-            bootstyle=PRIMARY,
-            anchor=W,
-        ).pack(side=TOP, padx=10, pady=10, anchor=W)
-
-        self.comment = tk.Text(self, height=4)
-        self.comment.pack(fill=X, pady=10)
-
-
-class QuestionFrame(ttk.Frame):
-    """
-    A frame that displays a question and its options.
+    Import the GUI toolkit and define the widget classes of the questionnaire.
+    This is deferred until the questionnaire is displayed so that importing
+    the tool stays cheap, and it is done only once.
     """
+    global gui
+    if gui is not None:
+        return gui
+
+    import tkinter as tk
+
+    import ttkbootstrap as ttk
+    from ttkbootstrap.scrolled import ScrolledFrame
+    from ttkbootstrap.constants import (
+        BOTH,
+        BOTTOM,
+        CENTER,
+        DEFAULT,
+        HORIZONTAL,
+        OUTLINE,
+        PRIMARY,
+        SECONDARY,
+        TOP,
+        W,
+        X,
+        YES,
+    )
 
-    def __init__(self, master, question_data, **kwargs) -> None:
-        super().__init__(master, **kwargs)
-        self.question_data = question_data
+    class Header(ttk.Frame):
+        """
+        A frame that displays the header of the questionnaire, including the
+        title, author, and introduction.
+        """
 
-        self.create_widgets()
+        def __init__(self, master, title, author, introduction, **kwargs) -> None:
+            super().__init__(master, **kwargs)
+            self.title = title
+            self.author = author
+            self.introduction = introduction
+
+            self.create_widgets()
+
+        def create_widgets(self) -> None:
+            """Create and pack the widgets for the header."""
+            title_label = ttk.Label(
+                self,
+                text=self.title,
+                font=FONT_H1,
+                justify=CENTER,
+                bootstyle=PRIMARY,
+            )
+            title_label.pack(pady=10)
+
+            author_label = ttk.Label(
+                self,
+                text=self.author,
+                font=FONT_BOLD,
+                justify=CENTER,
+                bootstyle=SECONDARY,
+            )
+            author_label.pack(pady=5)
+
+            introduction_label = ttk.Label(
+                self,
+                text=self.introduction,
+                font=FONT_NORMAL,
+                bootstyle=DEFAULT,
+            )
+            introduction_label.pack(pady=10)
+
+            self.wrap_labels = [title_label, author_label, introduction_label]
+
+    class CommentFrame(ttk.Frame):
+        """
+        A frame that allows the client to add additional comments.
+        """
 
-    def create_widgets(self) -> None:
-        """Create and pack the widgets for the question and its options."""
-        self.question_label = ttk.Label(
-            self,
-            text=self.question_data["question"],
-            font=("Helvetica", 12, "bold"),
-            justify=LEFT,
-            wraplength=WRAP_LENGTH,
-            bootstyle=PRIMARY,
-            anchor=W,
-        )
-        self.question_label.pack(side=TOP, padx=10, pady=10, anchor=W)
+        def __init__(self, master, **kwargs) -> None:
+            super().__init__(master, **kwargs)
 
-        options = self.question_data.get("options", [])
-        self.option_frames = []
-        for option in options:
-            option_frame = OptionFrame(self, option)
-            option_frame.pack(fill=X, pady=5)
-            self.option_frames.append(option_frame)
+            self.create_widgets()
 
-        self.custom_option = tk.Text(self, height=2)
-        self.custom_option.pack(fill=X, pady=10)
+        def create_widgets(self) -> None:
+            """Create and pack the widgets for the comment section."""
+            comment_label = ttk.Label(
+                self,
+                text="Any other comments?",
+                font=FONT_BOLD,
+                bootstyle=PRIMARY,
+                anchor=W,
+            )
+            comment_label.pack(side=TOP, padx=10, pady=10, anchor=W)
 
+            self.wrap_labels = [comment_label]
 
-class QuestionnaireFrame(ScrolledFrame):
-    """
-    A frame that contains the entire questionnaire, including the header,
-    questions, and comment section.
-    """
+            self.comment = tk.Text(self, height=4)
+            self.comment.pack(fill=X, pady=10)
 
-    def __init__(
-        self,
-        window,
-        title,
-        author,
-        introduction,
-        questions,
-        on_client_response,
-        **kwargs,
-    ) -> None:
-        super().__init__(master=window, autohide=YES, **kwargs)
-        self.title = title
-        self.author = author
-        self.introduction = introduction
-        self.questions = questions
+    class QuestionFrame(ttk.Frame):
+        """
+        A frame that displays a question and its options. The options are laid
+        out in a single grid with check buttons in the first column and option
+        texts in the second one.
+        """
 
-        self.on_client_response = on_client_response
+        def __init__(self, master, question_data, on_widgets_added, **kwargs) -> None:
+            super().__init__(master, **kwargs)
+            self.question_data = question_data
+            self.question_text = question_data.question
+
+            self.on_widgets_added = on_widgets_added
+
+            self.create_widgets()
+
+        def create_widgets(self) -> None:
+            """Create and pack the widgets for the question and its options."""
+            self.question_label = ttk.Label(
+                self,
+                text=self.question_text,
+                font=FONT_BOLD,
+                bootstyle=PRIMARY,
+                anchor=W,
+            )
+            self.question_label.pack(side=TOP, padx=10, pady=10, anchor=W)
+
+            self.wrap_labels = [self.question_label]
+
+            options = self.question_data.options
+            if not options:
+                # Open-ended question answered only by the client's own text
+                self.option_vars = ()
+                self.custom_option = tk.Text(self, height=3)
+                self.custom_option.pack(fill=X, pady=10)
+                return
+
+            options_container = ttk.Frame(self)
+            options_container.pack(fill=X)
+
+            self.option_vars = []
+            for i, option in enumerate(options):
+                var = tk.BooleanVar(value=False)
+                ttk.Checkbutton(options_container, variable=var).grid(
+                    row=i, column=0, pady=5, sticky=W
+                )
+                option_label = ttk.Label(options_container, text=option)
+                option_label.grid(row=i, column=1, pady=5, sticky=W)
+                self.wrap_labels.append(option_label)
+                self.option_vars.append((option, var))
+
+            # The custom option text is created only when the client asks for it
+            self.custom_option = None
+            self.custom_option_button = ttk.Button(
+                self,
+                text="+ Add custom answer",
+                command=self.add_custom_option,
+                bootstyle=(PRIMARY, OUTLINE),
+            )
+            self.custom_option_button.pack(anchor=W, padx=10, pady=10)
+
+        def add_custom_option(self) -> None:
+            """Replace the custom answer button with a text for the custom option."""
+            self.custom_option_button.destroy()
+
+            self.custom_option = tk.Text(self, height=2)
+            self.custom_option.pack(fill=X, pady=10)
+            self.custom_option.focus_set()
+
+            # Let the questionnaire bind the mousewheel to the new text as well
+            self.on_widgets_added()
+
+    class QuestionPlaceholder(ttk.Frame):
+        """
+        An empty frame that reserves approximately the space of a question until
+        the question is scrolled into view and replaced by a QuestionFrame.
+        """
 
-        self.create_widgets()
+        def __init__(self, master, question_data, **kwargs) -> None:
+            options = question_data.options
+            height = (
+                QUESTION_LABEL_HEIGHT
+                + OPTION_HEIGHT * len(options)
+                + CUSTOM_OPTION_HEIGHT
+            )
+            super().__init__(master, width=WRAP_LENGTH, height=height, **kwargs)
+            self.question_data = question_data
+            self.question_text = question_data.question
+
+    class QuestionnaireFrame(ScrolledFrame):
+        """
+        A frame that contains the entire questionnaire, including the header,
+        questions, and comment section.
+        """
 
-    def create_widgets(self) -> None:
-        """Create and pack the widgets for the entire questionnaire."""
-        Header(
+        def __init__(
             self,
-            title=self.title,
-            author=self.author,
-            introduction=self.introduction,
-        ).pack(anchor=CENTER)
-
-        ttk.Separator(self, orient=HORIZONTAL).pack(fill=X, pady=20)
-
-        questions_container = ttk.Frame(self)
-        questions_container.pack(anchor=CENTER)
-
-        self.question_frames = []
-        for question_data in self.questions:
-            question_frame = QuestionFrame(questions_container, question_data)
-            question_frame.pack(fill=X, padx=10, pady=10)
-            self.question_frames.append(question_frame)
-
-        self.comment_frame = CommentFrame(questions_container)
-        self.comment_frame.pack(fill=X, padx=10, pady=10)
-
-        ttk.Separator(self, orient=HORIZONTAL).pack(fill=X, pady=20)
-
-        ttk.Button(self, text="Submit", command=self.submit).pack(side=BOTTOM, pady=10)
-
-    def submit(self) -> None:
-        """Collect the client's responses and call the callback function."""
-        client_response_lines = [f'Client answers to the questionnaire "{self.title}":']
-
-        for question_frame in self.question_frames:
-            question_label = question_frame.question_label.cget("text")
-            client_response_lines.append(f"\n{question_label}")
-
-            for option_frame in question_frame.option_frames:
-                option = option_frame.option
-                checked = option_frame.check_button.instate(["selected"])
-                if checked:
-                    client_response_lines.append(f"  * {option}")
-
-            custom_option = question_frame.custom_option.get("1.0", "end-1c")
-            if custom_option:
-                client_response_lines.append(f"  + {custom_option}")
-
-        comment = self.comment_frame.comment.get("1.0", "end-1c")
-        if comment:
-            client_response_lines.append(f"\nClient comments:\n{comment}")
-
-        client_response = "\n".join(client_response_lines)
-        self.on_client_response(client_response)
+            window,
+            title,
+            author,
+            introduction,
+            questions,
+            on_client_response,
+            **kwargs,
+        ) -> None:
+            super().__init__(master=window, autohide=YES, **kwargs)
+            self.title = title
+            self.author = author
+            self.introduction = introduction
+            self.questions = questions
+
+            self.on_client_response = on_client_response
+
+            self.create_widgets()
+
+        def create_widgets(self) -> None:
+            """Create and pack the widgets for the entire questionnaire."""
+            header = Header(
+                self,
+                title=self.title,
+                author=self.author,
+                introduction=self.introduction,
+            )
+            header.pack(anchor=CENTER)
+
+            ttk.Separator(self, orient=HORIZONTAL).pack(fill=X, pady=20)
+
+            questions_container = ttk.Frame(self)
+            questions_container.pack(anchor=CENTER)
+
+            # Questions are rendered lazily as they are scrolled into view
+            self.question_frames = []
+            for question_data in self.questions:
+                placeholder = QuestionPlaceholder(questions_container, question_data)
+                placeholder.pack(fill=X, padx=10, pady=10)
+                self.question_frames.append(placeholder)
+
+            self.comment_frame = CommentFrame(questions_container)
+            self.comment_frame.pack(fill=X, padx=10, pady=10)
+
+            # Labels wrapped to the current width of the window
+            self.wrap_length = WRAP_LENGTH
+            self.wrap_labels = header.wrap_labels + self.comment_frame.wrap_labels
+
+            ttk.Separator(self, orient=HORIZONTAL).pack(fill=X, pady=20)
+
+            ttk.Button(self, text="Submit", command=self.submit).pack(
+                side=BOTTOM, pady=10
+            )
+
+            # The first pass runs on <Map>, since the Configure events sent
+            # during the initial layout arrive before the frame is mapped
+            self.bind("<Map>", self.render_visible_questions, "+")
+            self.bind("<Configure>", self.render_visible_questions, "+")
+            self.container.bind("<Configure>", self.render_visible_questions, "+")
+            self.bind("<Configure>", self.on_resize, "+")
+
+        def on_resize(self, event=None) -> None:
+            """Rewrap all the labels when the width of the window changes."""
+            wrap_length = self.winfo_toplevel().winfo_width() - WRAP_MARGIN
+            if wrap_length <= 0 or wrap_length == self.wrap_length:
+                return
+
+            self.wrap_length = wrap_length
+            for label in self.wrap_labels:
+                label.configure(wraplength=wrap_length)
+
+        def render_visible_questions(self, event=None) -> None:
+            """Replace the placeholders visible in the viewport with questions."""
+            if not self.winfo_ismapped():
+                return
+
+            viewport_top = self.container.winfo_rooty()
+            viewport_bottom = viewport_top + self.container.winfo_height()
+
+            rendered = False
+            for i, frame in enumerate(self.question_frames):
+                if not isinstance(frame, QuestionPlaceholder):
+                    continue
+
+                frame_top = frame.winfo_rooty()
+                if frame_top >= viewport_bottom:
+                    break
+                if frame_top + frame.winfo_height() <= viewport_top:
+                    continue
+
+                question_frame = QuestionFrame(
+                    frame.master, frame.question_data, self.enable_scrolling
+                )
+                question_frame.pack(fill=X, padx=10, pady=10, before=frame)
+                if self.wrap_length != WRAP_LENGTH:
+                    for label in question_frame.wrap_labels:
+                        label.configure(wraplength=self.wrap_length)
+                self.wrap_labels.extend(question_frame.wrap_labels)
+                frame.destroy()
+                self.question_frames[i] = question_frame
+                rendered = True
+
+            if rendered:
+                # Bind the mousewheel to the newly created widgets as well
+                self.enable_scrolling()
+
+        def submit(self) -> None:
+            """Collect the client's responses and call the callback function."""
+            buf = io.StringIO()
+            buf.write(f'Client answers to the questionnaire "{self.title}":')
+
+            for question_frame in self.question_frames:
+                buf.write("\n\n")
+                buf.write(question_frame.question_text)
+
+                # Questions never scrolled into view have no answers
+                if isinstance(question_frame, QuestionPlaceholder):
+                    continue
+
+                for option, var in question_frame.option_vars:
+                    if var.get():
+                        buf.write("\n  * ")
+                        buf.write(option)
+
+                if question_frame.custom_option is None:
+                    continue
+
+                custom_option = question_frame.custom_option.get("1.0", "end-1c")
+                if custom_option:
+                    buf.write("\n  + ")
+                    buf.write(custom_option)
+
+            comment = self.comment_frame.comment.get("1.0", "end-1c")
+            if comment:
+                buf.write("\n\nClient comments:\n")
+                buf.write(comment)
+
+            self.on_client_response(buf.getvalue())
+
+    gui = SimpleNamespace(ttk=ttk, QuestionnaireFrame=QuestionnaireFrame, BOTH=BOTH)
+    return gui
 
 
 class Questionnaire:
@@ -240,7 +399,7 @@ class Questionnaire:
         title: str,
         author: str,
         introduction: list,
-        questions: List[Dict[str, List[str]]],
+        questions: List["QuestionSchema"],
     ) -> None:
         self.title = title
         self.author = author
@@ -256,10 +415,20 @@ class Questionnaire:
 
     def get_client_response(self) -> str:
         """Display the questionnaire GUI and return the client's response."""
-        self.window = ttk.Window(title="Client Questionnaire", size=WINDOW_SIZE)
-        Style(theme="journal")
+        gui = load_gui()
 
-        qf = QuestionnaireFrame(
+        self.window = gui.ttk.Window(
+            title="Client Questionnaire", themename="journal", size=WINDOW_SIZE
+        )
+        # Tk draws nothing before mainloop() starts, so hiding the window while
+        # the widgets are built is only a safeguard in case events get
+        # processed earlier; the window is mapped and laid out in mainloop()
+        self.window.withdraw()
+        for pattern, value in OPTION_DEFAULTS.items():
+            self.window.option_add(pattern, value)
+        create_fonts()
+
+        qf = gui.QuestionnaireFrame(
             self.window,
             self.title,
             self.author,
@@ -267,7 +436,9 @@ class Questionnaire:
             self.questions,
             self.on_client_response,
         )
-        qf.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        qf.pack(fill=gui.BOTH, expand=True, padx=10, pady=10)
+
+        self.window.deiconify()
 
         self.window.mainloop()
 
@@ -304,35 +475,33 @@ class ClientQuestionnaireTool(BaseTool):
     """
 
     name: str = "Client Questionnaire Tool"
-    description: str = dedent(
-        """
-        This tools uses GUI to collects answers from a human client based 
-        on provided questions and respective options in a questionnaire.
-        """
+    description: str = (
+        "\n"
+        "This tools uses GUI to collects answers from a human client based \n"
+        "on provided questions and respective options in a questionnaire.\n"
     )
     args_schema: Type[BaseModel] = QuestionnaireSchema
 
-    client_response: str = dedent(
-        """
-        Client answers to the questionnaire "{title}":
-
-        {question_A}
-            * {option_A1}
-            * {option_A2}
-              ...
-            + {optional_client_custom_options_A}>
-
-        {question_B}
-            * {option_B1}
-            * {option_B2}
-                ...
-            + {optional_client_custom_options}
-
-        ...
-
-        Client comments:
-        {client_comments}
-        """
+    client_response: str = (
+        "\n"
+        'Client answers to the questionnaire "{title}":\n'
+        "\n"
+        "{question_A}\n"
+        "    * {option_A1}\n"
+        "    * {option_A2}\n"
+        "      ...\n"
+        "    + {optional_client_custom_options_A}>\n"
+        "\n"
+        "{question_B}\n"
+        "    * {option_B1}\n"
+        "    * {option_B2}\n"
+        "        ...\n"
+        "    + {optional_client_custom_options}\n"
+        "\n"
+        "...\n"
+        "\n"
+        "Client comments:\n"
+        "{client_comments}\n"
     )
 
     def _run(self, **kwargs) -> str:
@@ -340,7 +509,7 @@ class ClientQuestionnaireTool(BaseTool):
         title = kwargs.get("title", "No title")
         author = kwargs.get("author", "No author")
         introduction = kwargs.get("introduction", "No introduction")
-        questions = [question.dict() for question in kwargs.get("questions", [])]
+        questions = kwargs.get("questions", [])
 
         q = Questionnaire(title, author, introduction, questions)
         result = q.get_client_response()